@@ -1,70 +1,132 @@
 """Configuration management for API credentials."""
+import functools
 import os
-from dotenv import load_dotenv
+from pathlib import Path
+
+# .env lives at the project root, one level above app/
+ENV_FILE = Path(__file__).resolve().parent.parent / ".env"
+
+# Every variable Config reads; when all are already set there is nothing to load
+_KEYS = (
+    "IMPACT_ACCOUNT_SID", "IMPACT_AUTH_TOKEN",
+    "CJ_API_KEY",
+    "AWIN_API_KEY", "AWIN_PUBLISHER_ID",
+    "PARTNERSTACK_API_KEY",
+    "SERPAPI_API_KEY",
+    "GOOGLE_SERVICE_ACCOUNT_JSON", "GOOGLE_SHEET_URL",
+    "GOOGLE_OAUTH_CLIENT_JSON", "ALLOWED_EMAIL_DOMAINS",
+    "COOKIE_SECRET", "OAUTH_REDIRECT_URI",
+)
+
+# Hosting platforms that inject the environment themselves and never ship a .env
+_PLATFORM_MARKERS = (
+    "RENDER",                   # Render
+    "DYNO",                     # Heroku (Procfile)
+    "RAILWAY_ENVIRONMENT",      # Railway
+    "KUBERNETES_SERVICE_HOST",  # Kubernetes
+    "AWS_LAMBDA_FUNCTION_NAME", # AWS Lambda
+)
+
+
+def _load_dotenv() -> None:
+    """Load variables from .env unless running on a hosting platform or DOTENV_SKIP=1 is set."""
+    if os.environ.get("DOTENV_SKIP") == "1":
+        return
+    if any(marker in os.environ for marker in _PLATFORM_MARKERS):
+        return
+    if all(key in os.environ for key in _KEYS) or not ENV_FILE.is_file():
+        return
+    from dotenv import load_dotenv
+    load_dotenv(ENV_FILE, override=False, verbose=False)
+
+
+_load_dotenv()
+
+# Single snapshot of the environment, taken once after .env has been applied
+_env = os.environ.copy()
 
-load_dotenv()
 
 class Config:
     """Application configuration."""
 
     # Impact API
-    IMPACT_ACCOUNT_SID = os.getenv("IMPACT_ACCOUNT_SID", "")
-    IMPACT_AUTH_TOKEN = os.getenv("IMPACT_AUTH_TOKEN", "")
+    IMPACT_ACCOUNT_SID = _env.get("IMPACT_ACCOUNT_SID", "")
+    IMPACT_AUTH_TOKEN = _env.get("IMPACT_AUTH_TOKEN", "")
 
     # CJ API
-    CJ_API_KEY = os.getenv("CJ_API_KEY", "")
+    CJ_API_KEY = _env.get("CJ_API_KEY", "")
 
     # Awin API
-    AWIN_API_KEY = os.getenv("AWIN_API_KEY", "")
-    AWIN_PUBLISHER_ID = os.getenv("AWIN_PUBLISHER_ID", "")
+    AWIN_API_KEY = _env.get("AWIN_API_KEY", "")
+    AWIN_PUBLISHER_ID = _env.get("AWIN_PUBLISHER_ID", "")
 
     # Partnerstack API
-    PARTNERSTACK_API_KEY = os.getenv("PARTNERSTACK_API_KEY", "")
+    PARTNERSTACK_API_KEY = _env.get("PARTNERSTACK_API_KEY", "")
 
     # SerpAPI
-    SERPAPI_API_KEY = os.getenv("SERPAPI_API_KEY", "")
+    SERPAPI_API_KEY = _env.get("SERPAPI_API_KEY", "")
 
     # Google Sheets Integration
-    GOOGLE_SERVICE_ACCOUNT_JSON = os.getenv("GOOGLE_SERVICE_ACCOUNT_JSON", "")
-    GOOGLE_SHEET_URL = os.getenv("GOOGLE_SHEET_URL", "")
+    GOOGLE_SERVICE_ACCOUNT_JSON = _env.get("GOOGLE_SERVICE_ACCOUNT_JSON", "")
+    GOOGLE_SHEET_URL = _env.get("GOOGLE_SHEET_URL", "")
 
     # Google OAuth Login
-    GOOGLE_OAUTH_CLIENT_JSON = os.getenv("GOOGLE_OAUTH_CLIENT_JSON", "")
-    ALLOWED_EMAIL_DOMAINS = [d.strip() for d in os.getenv("ALLOWED_EMAIL_DOMAINS", "").split(",") if d.strip()]
-    COOKIE_SECRET = os.getenv("COOKIE_SECRET", "aff-finder-default-cookie-key")
-    OAUTH_REDIRECT_URI = os.getenv("OAUTH_REDIRECT_URI", "http://localhost:8501")
+    GOOGLE_OAUTH_CLIENT_JSON = _env.get("GOOGLE_OAUTH_CLIENT_JSON", "")
+    ALLOWED_EMAIL_DOMAINS = [d.strip() for d in _env.get("ALLOWED_EMAIL_DOMAINS", "").split(",") if d.strip()]
+    COOKIE_SECRET = _env.get("COOKIE_SECRET", "aff-finder-default-cookie-key")
+    OAUTH_REDIRECT_URI = _env.get("OAUTH_REDIRECT_URI", "http://localhost:8501")
 
     @classmethod
+    @functools.cache
     def is_impact_configured(cls) -> bool:
         """Check if Impact credentials are set."""
         return bool(cls.IMPACT_ACCOUNT_SID and cls.IMPACT_AUTH_TOKEN)
 
     @classmethod
+    @functools.cache
     def is_cj_configured(cls) -> bool:
         """Check if CJ credentials are set."""
         return bool(cls.CJ_API_KEY)
 
     @classmethod
+    @functools.cache
     def is_awin_configured(cls) -> bool:
         """Check if Awin credentials are set."""
         return bool(cls.AWIN_API_KEY and cls.AWIN_PUBLISHER_ID)
 
     @classmethod
+    @functools.cache
     def is_partnerstack_configured(cls) -> bool:
         """Check if Partnerstack credentials are set."""
         return bool(cls.PARTNERSTACK_API_KEY)
 
     @classmethod
+    @functools.cache
     def is_serpapi_configured(cls) -> bool:
         """Check if SerpAPI credentials are set."""
         return bool(cls.SERPAPI_API_KEY)
 
     @classmethod
+    @functools.cache
     def is_sheets_configured(cls) -> bool:
         """Check if Google Sheets credentials are set."""
         return bool(cls.GOOGLE_SERVICE_ACCOUNT_JSON and cls.GOOGLE_SHEET_URL)
 
     @classmethod
     def is_oauth_configured(cls) -> bool:
-        """Check if Google OAuth credentials are set."""
+        """Check if Google OAuth credentials are set (not memoized: the client JSON may appear after startup)."""
         return bool(cls.GOOGLE_OAUTH_CLIENT_JSON) and os.path.exists(cls.GOOGLE_OAUTH_CLIENT_JSON)
+
+
+_configured = [
+    name for name, ok in (
+        ("awin", Config.is_awin_configured()),
+        ("cj", Config.is_cj_configured()),
+        ("impact", Config.is_impact_configured()),
+        ("oauth", Config.is_oauth_configured()),
+        ("partnerstack", Config.is_partnerstack_configured()),
+        ("serpapi", Config.is_serpapi_configured()),
+        ("sheets", Config.is_sheets_configured()),
+    ) if ok
+]
+print(f"Config: configured providers: {', '.join(_configured) or 'none'}")
@@ -0,0 +1,165 @@
+"""Floating feedback bubble injected into the parent page by components.html.
+
+The escaped signed-in user name goes where __FB_USER__ sits in the template.
+"""
+import html
+
+_FB_HTML_TEMPLATE = """
+<script>
+(function() {
+    var doc = window.parent.document;
+
+    // Only inject once
+    if (doc.getElementById('fb-bubble')) return;
+
+    // Inject styles into parent
+    var style = doc.createElement('style');
+    style.textContent = `
+        #fb-bubble {
+            position: fixed;
+            bottom: 24px;
+            right: 24px;
+            z-index: 100000;
+            width: 56px;
+            height: 56px;
+            border-radius: 50%;
+            background: linear-gradient(135deg, #6366f1, #4f46e5);
+            color: white;
+            border: none;
+            font-size: 24px;
+            cursor: pointer;
+            box-shadow: 0 4px 16px rgba(99,102,241,0.45);
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            transition: all 0.2s;
+        }
+        #fb-bubble:hover {
+            transform: scale(1.1);
+            box-shadow: 0 6px 24px rgba(99,102,241,0.55);
+        }
+        #fb-popup {
+            display: none;
+            position: fixed;
+            bottom: 92px;
+            right: 24px;
+            z-index: 100000;
+            width: 340px;
+            background: white;
+            border-radius: 16px;
+            box-shadow: 0 12px 40px rgba(0,0,0,0.2);
+            padding: 24px;
+            border: 1px solid #e5e7eb;
+        }
+        #fb-popup.open { display: block; }
+        #fb-popup h3 {
+            margin: 0 0 16px;
+            font-size: 17px;
+            font-weight: 700;
+            color: #1e293b;
+            font-family: -apple-system, BlinkMacSystemFont, sans-serif;
+        }
+        #fb-popup input, #fb-popup textarea {
+            width: 100%;
+            padding: 10px 12px;
+            border: 1px solid #d1d5db;
+            border-radius: 8px;
+            font-size: 14px;
+            font-family: inherit;
+            margin-bottom: 10px;
+            box-sizing: border-box;
+            outline: none;
+        }
+        #fb-popup input:focus, #fb-popup textarea:focus {
+            border-color: #6366f1;
+            box-shadow: 0 0 0 3px rgba(99,102,241,0.1);
+        }
+        #fb-popup textarea { height: 80px; resize: vertical; }
+        #fb-send-btn {
+            width: 100%;
+            padding: 11px;
+            background: linear-gradient(135deg, #6366f1, #4f46e5);
+            color: white;
+            border: none;
+            border-radius: 10px;
+            font-size: 14px;
+            font-weight: 600;
+            cursor: pointer;
+            font-family: inherit;
+        }
+        #fb-send-btn:hover { opacity: 0.9; }
+        #fb-status { margin-top: 8px; font-size: 13px; text-align: center; }
+    `;
+    doc.head.appendChild(style);
+
+    // Create bubble
+    var bubble = doc.createElement('div');
+    bubble.id = 'fb-bubble';
+    bubble.textContent = String.fromCodePoint(0x1F4AC);
+    doc.body.appendChild(bubble);
+
+    // Create popup
+    var popup = doc.createElement('div');
+    popup.id = 'fb-popup';
+    var fbUser = '__FB_USER__';
+    var nameField = fbUser
+        ? '<input type="text" id="fb-name" value="' + fbUser + '" readonly style="background:#f1f5f9;color:#475569;">'
+        : '<input type="text" id="fb-name" placeholder="Your name" required>';
+    popup.innerHTML = '<h3>Feedback</h3>'
+        + nameField
+        + '<textarea id="fb-msg" placeholder="What do you think? Any issues or suggestions?"></textarea>'
+        + '<button id="fb-send-btn">Send Feedback</button>'
+        + '<div id="fb-status"></div>';
+    doc.body.appendChild(popup);
+
+    // Toggle popup on bubble click
+    bubble.addEventListener('click', function() {
+        popup.classList.toggle('open');
+    });
+
+    // Submit feedback
+    doc.getElementById('fb-send-btn').addEventListener('click', function() {
+        var name = doc.getElementById('fb-name').value.trim();
+        var msg = doc.getElementById('fb-msg').value.trim();
+        var status = doc.getElementById('fb-status');
+        if (!name) {
+            status.innerHTML = '<span style="color:#f59e0b;">Please enter your name</span>';
+            return;
+        }
+        if (!msg) {
+            status.innerHTML = '<span style="color:#f59e0b;">Please enter a message</span>';
+            return;
+        }
+        status.innerHTML = '<span style="color:#6366f1;">Sending...</span>';
+        doc.getElementById('fb-name').value = '';
+        doc.getElementById('fb-msg').value = '';
+        var url = new URL(window.parent.location.href);
+        url.searchParams.set('fb_name', name);
+        url.searchParams.set('fb_msg', msg);
+        url.searchParams.set('fb_send', '1');
+        setTimeout(function() {
+            status.innerHTML = '<span style="color:#10b981;">&#10003; Sent! Thank you.</span>';
+            setTimeout(function() {
+                window.parent.location.href = url.toString();
+            }, 800);
+        }, 200);
+    });
+})();
+</script>
+"""
+
+
+def _minify(source):
+    """Drop indentation, blank lines and whole-line // comments (line breaks kept for ASI)."""
+    lines = (line.strip() for line in source.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//'))
+
+
+# Minified and split once per process: main.py is re-executed on every
+# Streamlit rerun, but this module stays in sys.modules
+_FB_HTML_PREFIX, _FB_HTML_SUFFIX = _minify(_FB_HTML_TEMPLATE).split('__FB_USER__', 1)
+
+
+def feedback_bubble_html(user_name):
+    """Feedback bubble markup for components.html, tagged with the escaped user name."""
+    return _FB_HTML_PREFIX + html.escape(user_name or '') + _FB_HTML_SUFFIX
@@ -1,11 +1,20 @@
 """Main Streamlit application for Affiliate Offer Finder."""
 import streamlit as st
 import pandas as pd
+import csv
 import html
-import re
+import io
+import logging
+from collections import Counter
 from services.aggregator import OfferAggregator
 from services.yt_serp import YTSerpService
 from config import Config
+from feedback_bubble import feedback_bubble_html
+from text_utils import clip_html, strip_html_tags
+
+# Network modules log through `logging`; show their INFO status lines in the
+# server console (per-row DEBUG detail stays off)
+logging.basicConfig(level=logging.INFO, format="%(name)s: %(message)s")
 
 # Page config
 st.set_page_config(
@@ -19,10 +28,10 @@ st.set_page_config(
 st.markdown("""
 <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/css/bootstrap.min.css" rel="stylesheet">
 <link href="https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.3/font/bootstrap-icons.css" rel="stylesheet">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+<link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
 <style>
     /* Bootstrap integration */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
-
     * {
         font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
     }
@@ -319,19 +328,17 @@ st.markdown("""
         line-height: 1.6;
     }
 </style>
-<script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/js/bootstrap.bundle.min.js"></script>
 """, unsafe_allow_html=True)
 
-# Helper function to strip HTML tags
-def strip_html_tags(text):
-    """Remove HTML tags from text."""
-    if not text:
-        return text
-    # Remove HTML tags
-    clean_text = re.sub(r'<[^>]+>', '', text)
-    # Remove extra whitespace
-    clean_text = re.sub(r'\s+', ' ', clean_text).strip()
-    return clean_text
+# Card colour thresholds (green / amber / red)
+_GOOD_COLOR = "#10b981"
+_FAIR_COLOR = "#f59e0b"
+_POOR_COLOR = "#ef4444"
+_COMPETITION_COLORS = {"Very Low": _GOOD_COLOR, "Low": _GOOD_COLOR, "Medium": _FAIR_COLOR}
+
+def _score_color(score):
+    """Colour for a 0-100 scalability score."""
+    return _GOOD_COLOR if score >= 75 else _FAIR_COLOR if score >= 50 else _POOR_COLOR
 
 # Initialize aggregator (cached so Google Sheets connection is reused across reruns)
 @st.cache_resource
@@ -339,6 +346,23 @@ def get_aggregator():
     """Initialize and cache the aggregator."""
     return OfferAggregator()
 
+class _NoOffersFound(Exception):
+    """Raised inside search_offers_cached so an empty result isn't cached."""
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def search_offers_cached(keyword, limit):
+    """Search discovery networks, caching non-empty results per keyword and limit for an hour."""
+    offers = get_aggregator().search_discovery_networks(
+        keyword=keyword,
+        limit=limit,
+        analyze_potential=True,
+    )
+    # Empty usually means every network failed; raising keeps it out of the
+    # cache so the next search retries (like the Sheets write-only-if-offers rule)
+    if not offers:
+        raise _NoOffersFound()
+    return offers
+
 @st.cache_resource
 def get_yt_serp():
     """Initialize and cache the YT SERP service."""
@@ -350,7 +374,7 @@ def get_yt_serp():
 
 def _render_gaps_cards(gaps):
     """Render competitor gap cards as HTML."""
-    cards = '<div>'
+    parts = ['<div>']
     for idx, g in enumerate(gaps, 1):
         sv = g["search_volume"]
         sv_display = f"{sv:,}" if sv < 10000 else f"{sv/1000:.0f}K"
@@ -358,7 +382,7 @@ def _render_gaps_cards(gaps):
         silo_badge = f'<span class="custom-badge badge-info">{html.escape(g["silo"])}</span>' if g["silo"] else ''
         nc = g["num_competitors"]
         comp_color = "#ef4444" if nc >= 15 else "#f59e0b" if nc >= 8 else "#10b981"
-        cards += (
+        parts.append(
             '<div class="offer-card" style="cursor:default">'
             '<div style="display:flex;justify-content:space-between;align-items:center">'
             '<div style="flex:1">'
@@ -379,13 +403,13 @@ def _render_gaps_cards(gaps):
             f'<div style="margin-top:10px;font-size:12px;color:#94a3b8"><i class="bi bi-tv"></i> {html.escape(g["channels"][:80])}</div>'
             '</div>'
         )
-    cards += '</div>'
-    st.markdown(cards, unsafe_allow_html=True)
+    parts.append('</div>')
+    st.markdown(''.join(parts), unsafe_allow_html=True)
 
 
 def _render_outranking_cards(outranking):
     """Render outranking cards as HTML."""
-    cards = '<div>'
+    parts = ['<div>']
     for idx, o in enumerate(outranking, 1):
         sv = o["search_volume"]
         sv_display = f"{sv:,}" if sv < 10000 else f"{sv/1000:.0f}K"
@@ -393,7 +417,7 @@ def _render_outranking_cards(outranking):
         rank_diff = o["dg_rank"] - o["best_comp_rank"]
         dg_views = f"{o['dg_views']:,}"
         comp_views = f"{o['top_comp_views']:,}"
-        cards += (
+        parts.append(
             '<div class="offer-card" style="cursor:default">'
             '<div style="display:flex;justify-content:space-between;align-items:center">'
             '<div style="flex:1">'
@@ -420,8 +444,182 @@ def _render_outranking_cards(outranking):
             f'<div style="margin-top:6px;font-size:12px;color:#94a3b8"><i class="bi bi-tv"></i> {html.escape(o["channels"][:80])}</div>'
             '</div>'
         )
-    cards += '</div>'
-    st.markdown(cards, unsafe_allow_html=True)
+    parts.append('</div>')
+    st.markdown(''.join(parts), unsafe_allow_html=True)
+
+
+# CSV export layout: (header, Offer attribute)
+_EXPORT_COLUMNS = (
+    ("Name", "name"),
+    ("Advertiser", "advertiser_name"),
+    ("Network", "network"),
+    ("Commission Type", "commission_type"),
+    ("Commission", "commission_value"),
+    ("EPC", "epc"),
+    ("Conv Rate", "conversion_rate"),
+    ("YouTube Score", "youtube_score"),
+    ("Scalability Score", "scalability_score"),
+    ("Traffic", "traffic_monthly"),
+    ("Cookie Duration", "cookie_duration"),
+    ("Growth", "growth_percentage"),
+    ("Competition", "competition_level"),
+    ("Domain Authority", "domain_authority"),
+    ("Instagram", "instagram_followers"),
+    ("Category", "category"),
+    ("Tracking URL", "tracking_url"),
+)
+
+
+# Offer cards rendered per page
+_CARDS_PER_PAGE = 20
+
+
+def _change_page(delta):
+    """Move the offer-card page forward or back (button callback)."""
+    st.session_state.page = max(0, st.session_state.get('page', 0) + delta)
+
+
+def _build_offer_cards_html(offers, start=1):
+    """Build the HTML for a page of offer cards as a single block, numbered from start."""
+    # Build all cards in one HTML block to avoid Streamlit containers
+    parts = ['<div>']
+
+    for idx, offer in enumerate(offers, start):
+        is_direct = offer.category == "Direct Brand"
+
+        # Build card HTML - wrap entire card in anchor tag when there is a link
+        if offer.tracking_url:
+            parts.append(f'<a href="{html.escape(offer.tracking_url)}" target="_blank" rel="noopener" class="offer-card">')
+            close_tag = '</a>'
+        else:
+            parts.append('<div class="offer-card" style="cursor: default;">')
+            close_tag = '</div>'
+
+        parts.append('<div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 16px;">')
+
+        # Left side
+        parts.append('<div style="flex: 1; min-width: 0;">')
+
+        # Title row
+        parts.append('<div style="display: flex; align-items: center; margin-bottom: 12px;">')
+        parts.append(f'<span class="number-badge">{idx}</span>')
+
+        clean_name = strip_html_tags(offer.name)
+        safe_name = html.escape(clean_name)
+        parts.append(f'<span class="card-title">{safe_name}</span>')
+
+        parts.append('</div>')
+
+        # Badges row
+        parts.append('<div style="display: flex; flex-wrap: wrap; gap: 8px;">')
+
+        clean_advertiser = strip_html_tags(offer.advertiser_name)
+        safe_advertiser = html.escape(clean_advertiser)
+        parts.append(f'<span class="custom-badge badge-primary"><i class="bi bi-building"></i> {safe_advertiser}</span>')
+
+        if is_direct:
+            parts.append('<span class="custom-badge badge-success"><i class="bi bi-bullseye"></i> Direct Brand</span>')
+        else:
+            parts.append('<span class="custom-badge badge-info"><i class="bi bi-newspaper"></i> Blog Post</span>')
+
+        if offer.network:
+            # Network ids are set by our own connectors, not scraped markup
+            safe_network = html.escape(offer.network)
+            parts.append(f'<span class="custom-badge badge-warning"><i class="bi bi-diagram-3"></i> {safe_network}</span>')
+
+        parts.append('</div>')
+        parts.append('</div>')  # Close left side
+
+        # Right side: Commission badge + Potential score
+        parts.append('<div style="margin-left: 20px; flex-shrink: 0; display: flex; flex-direction: column; gap: 8px; align-items: flex-end;">')
+
+        # Commission badge
+        if is_direct and offer.commission_value:
+            if offer.commission_type == "Percentage":
+                parts.append(f'<div class="commission-badge"><i class="bi bi-cash-coin"></i> {int(offer.commission_value)}%</div>')
+            elif offer.commission_type == "Fixed":
+                parts.append(f'<div class="commission-badge"><i class="bi bi-currency-dollar"></i> ${int(offer.commission_value)}</div>')
+        else:
+            if is_direct:
+                parts.append('<span class="category-icon">🎯</span>')
+            else:
+                parts.append('<span class="category-icon">📰</span>')
+
+        parts.append('</div>')
+
+        parts.append('</div>')  # Close flex container
+
+        # Description INSIDE the card (unified with card styling)
+        if offer.description:
+            # Oversized slice first so long descriptions aren't regex-scanned in full
+            was_cut = len(offer.description) > 2000
+            clean_desc = strip_html_tags(clip_html(offer.description, 2000))
+            desc = clean_desc[:200] + "..." if was_cut or len(clean_desc) > 200 else clean_desc
+            safe_desc = html.escape(desc)
+            parts.append(f'<div style="margin-top: 16px;"><p style="color: #64748b; font-size: 14px; line-height: 1.6; margin: 0;">{safe_desc}</p></div>')
+
+        # Scalability Metrics
+        if offer.scalability_score is not None:
+            parts.append('<div style="margin-top: 16px; padding: 12px; background: linear-gradient(135deg, #f8fafc 0%, #f1f5f9 100%); border-radius: 8px; border-left: 3px solid #3b82f6;">')
+
+            # Scalability score header
+            score_color = _score_color(offer.scalability_score)
+            parts.append(f'<div style="margin-bottom: 10px;"><span style="color: #1e293b; font-size: 13px; font-weight: 700;"><i class="bi bi-graph-up-arrow"></i> Scalability:</span> <span style="color: {score_color}; font-weight: 700; font-size: 14px;">{offer.scalability_score}/100</span></div>')
+
+            # Metrics grid
+            parts.append('<div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 8px; font-size: 11px;">')
+
+            # Row 1
+            if offer.traffic_monthly:
+                parts.append(f'<div style="color: #475569;"><i class="bi bi-globe" style="color: #3b82f6;"></i> Traffic: <span style="font-weight: 600;">{html.escape(offer.traffic_monthly)}</span></div>')
+
+            if offer.cookie_duration:
+                parts.append(f'<div style="color: #475569;"><i class="bi bi-clock" style="color: #8b5cf6;"></i> Cookie: <span style="font-weight: 600;">{offer.cookie_duration} days</span></div>')
+
+            if offer.growth_percentage:
+                growth_color = _GOOD_COLOR if offer.growth_percentage.startswith('+') else _POOR_COLOR
+                parts.append(f'<div style="color: #475569;"><i class="bi bi-graph-up" style="color: {growth_color};"></i> Growth: <span style="font-weight: 600; color: {growth_color};">{html.escape(offer.growth_percentage)}</span></div>')
+
+            # Row 2
+            if offer.competition_level:
+                comp_color = _COMPETITION_COLORS.get(offer.competition_level, _POOR_COLOR)
+                parts.append(f'<div style="color: #475569;"><i class="bi bi-bullseye" style="color: {comp_color};"></i> Competition: <span style="font-weight: 600; color: {comp_color};">{html.escape(offer.competition_level)}</span></div>')
+
+            if offer.domain_authority:
+                parts.append(f'<div style="color: #475569;"><i class="bi bi-award" style="color: #f59e0b;"></i> DA: <span style="font-weight: 600;">{offer.domain_authority}/100</span></div>')
+
+            if offer.instagram_followers:
+                parts.append(f'<div style="color: #475569;"><i class="bi bi-instagram" style="color: #ec4899;"></i> IG: <span style="font-weight: 600;">{html.escape(offer.instagram_followers)}</span></div>')
+
+            parts.append('</div>')  # Close grid
+            parts.append('</div>')  # Close scalability section
+
+        # Related Keywords for SEO
+        if offer.related_keywords and len(offer.related_keywords) > 0:
+            parts.append('<div style="margin-top: 12px; display: flex; flex-wrap: wrap; gap: 6px; align-items: center;">')
+            parts.append('<span style="color: #64748b; font-size: 12px; font-weight: 600; margin-right: 4px;"><i class="bi bi-search"></i> SEO Keywords:</span>')
+
+            for kw_data in offer.related_keywords[:5]:  # Show max 5 keywords
+                # Handle both dict format (new) and string format (old)
+                if isinstance(kw_data, dict):
+                    keyword = kw_data.get("keyword", "")
+                    volume = kw_data.get("volume", "")
+                    safe_kw = html.escape(keyword)
+                    safe_vol = html.escape(volume)
+                    parts.append(f'<span style="background: #f1f5f9; color: #475569; padding: 4px 10px; border-radius: 8px; font-size: 11px; font-weight: 500;">{safe_kw} <span style="color: #94a3b8;">• {safe_vol}</span></span>')
+                else:
+                    # Fallback for string format
+                    safe_kw = html.escape(str(kw_data))
+                    parts.append(f'<span style="background: #f1f5f9; color: #475569; padding: 4px 10px; border-radius: 8px; font-size: 11px; font-weight: 500;">{safe_kw}</span>')
+
+            parts.append('</div>')
+
+        # Close card HTML
+        parts.append(close_tag)
+
+    parts.append('</div>')
+
+    return ''.join(parts)
 
 
 def main():
@@ -474,7 +672,7 @@ def main():
                     authenticator.logout()
                 st.stop()
 
-    # Hero section with Bootstrap styling
+    # Hero section and results header with Bootstrap styling (one element)
     st.markdown("""
     <div style="text-align: center; padding: 30px 0 40px 0;">
         <h1 style="font-size: 48px; margin-bottom: 16px;">
@@ -484,6 +682,7 @@ def main():
             Discover profitable affiliate programs for your niche with commission details
         </p>
     </div>
+    <h2 style="color: #1e293b; font-weight: 700; margin-bottom: 24px;"><i class="bi bi-grid-3x3-gap"></i> Search Results</h2>
     """, unsafe_allow_html=True)
 
     aggregator = get_aggregator()
@@ -545,15 +744,9 @@ def main():
 
         # (Feedback form moved to floating chat bubble)
 
-    # Main content header
-    st.markdown('<h2 style="color: #1e293b; font-weight: 700; margin-bottom: 24px;"><i class="bi bi-grid-3x3-gap"></i> Search Results</h2>', unsafe_allow_html=True)
-
-    # Detect keyword or marketplace toggle change — re-fetch when source changes
+    # Keyword or marketplace toggle changes only take effect on Search, so
+    # editing the sidebar never triggers the slow fetch by itself
     current_source = "marketplace" if browse_marketplace else (keyword or "software")
-    if 'previous_source' in st.session_state and st.session_state.previous_source != current_source:
-        if 'all_offers' in st.session_state:
-            del st.session_state.all_offers
-    st.session_state.previous_source = current_source
 
     # Fetch all offers once, then filter by mode (mode change = instant, no re-fetch)
     need_fetch = search_triggered or force_refresh or 'all_offers' not in st.session_state
@@ -582,16 +775,37 @@ def main():
                 except Exception as e:
                     print(f"Error reading marketplace: {e}")
         else:
-            all_offers = aggregator.search_discovery_networks(
-                keyword=keyword if keyword else None,
-                limit=limit * 2,
-                analyze_potential=True,
-                force_refresh=force_refresh
-            )
+            if force_refresh:
+                # Drop cached searches so the fresh results are what gets served next
+                search_offers_cached.clear()
+                all_offers = aggregator.search_discovery_networks(
+                    keyword=keyword if keyword else None,
+                    limit=limit * 2,
+                    analyze_potential=True,
+                    force_refresh=True
+                )
+            else:
+                try:
+                    all_offers = search_offers_cached(keyword if keyword else None, limit * 2)
+                except _NoOffersFound:
+                    all_offers = []
+
+        # Bucket by category once so mode switches are a dict lookup
+        by_category = {"Direct Brand": [], "Blog Post": []}
+        for o in all_offers:
+            bucket = by_category.get(o.category)
+            if bucket is not None:
+                bucket.append(o)
 
         st.session_state.all_offers = all_offers
+        st.session_state.by_category = by_category
+        st.session_state.fetch_id = st.session_state.get('fetch_id', 0) + 1
+        st.session_state.fetched_source = current_source
         loading_placeholder.empty()
 
+    if not show_competitor_gaps and st.session_state.get('fetched_source', current_source) != current_source:
+        st.info("Filters changed — press Search Offers to refresh the results.")
+
     # =====================================================================
     # YT Competitor Gaps (when toggled, replaces the offers view)
     # =====================================================================
@@ -640,10 +854,11 @@ def main():
 
         # Filter by mode from in-memory cache (instant, no API/sheets call)
         all_offers = st.session_state.get('all_offers', [])
+        by_category = st.session_state.get('by_category', {})
         if search_mode == "Direct":
-            offers = [o for o in all_offers if o.category == "Direct Brand"]
+            offers = by_category.get("Direct Brand", [])
         elif search_mode == "Blog Post":
-            offers = [o for o in all_offers if o.category == "Blog Post"]
+            offers = by_category.get("Blog Post", [])
         else:
             offers = all_offers
         # Sort by commission value (highest first)
@@ -671,8 +886,9 @@ def main():
             </div>
             """, unsafe_allow_html=True)
         elif mode == "All":
-            direct_count = len([o for o in offers if o.category == "Direct Brand"])
-            blog_count = len([o for o in offers if o.category == "Blog Post"])
+            cats = Counter(o.category for o in offers)
+            direct_count = cats["Direct Brand"]
+            blog_count = cats["Blog Post"]
             st.markdown(f"""
             <div class="alert alert-success" role="alert" style="border-left: 4px solid #10b981; background-color: #f0fdf4; border-radius: 8px; padding: 16px;">
                 <strong><i class="bi bi-check-circle"></i> Success:</strong> Found {len(offers)} offers total
@@ -682,156 +898,55 @@ def main():
         else:
             st.success(f"Found {len(offers)} offers")
 
-        # Show last updated date
+        # Show last updated date for the results on screen, which may predate
+        # sidebar edits that haven't been searched yet
         if aggregator.sheets_cache:
-            effective_kw = keyword if keyword else "software"
+            fetched_source = st.session_state.get('fetched_source', current_source)
+            sheet_tab = "impact_marketplace" if fetched_source == "marketplace" else fetched_source
             try:
-                last_updated = aggregator.sheets_cache.get_last_updated(effective_kw)
+                last_updated = aggregator.sheets_cache.get_last_updated(sheet_tab)
                 if last_updated:
                     st.caption(f"Last updated: {last_updated.strftime('%B %d, %Y')}")
             except Exception:
                 pass
 
-        # Build all cards in one HTML block to avoid Streamlit containers
-        all_cards_html = '<div>'
-
-        for idx, offer in enumerate(offers[:limit], 1):
-            # Determine the link URL
-            safe_url = html.escape(offer.tracking_url) if offer.tracking_url else "#"
-
-            # Build card HTML - wrap entire card in anchor tag
-            if offer.tracking_url:
-                all_cards_html += f'<a href="{safe_url}" target="_blank" class="offer-card">'
-            else:
-                all_cards_html += '<div class="offer-card" style="cursor: default;">'
-
-            all_cards_html += '<div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 16px;">'
-
-            # Left side
-            all_cards_html += '<div style="flex: 1; min-width: 0;">'
-
-            # Title row
-            all_cards_html += '<div style="display: flex; align-items: center; margin-bottom: 12px;">'
-            all_cards_html += f'<span class="number-badge">{idx}</span>'
-
-            clean_name = strip_html_tags(offer.name)
-            safe_name = html.escape(clean_name)
-            all_cards_html += f'<span class="card-title">{safe_name}</span>'
-
-            all_cards_html += '</div>'
-
-            # Badges row
-            all_cards_html += '<div style="display: flex; flex-wrap: wrap; gap: 8px;">'
-
-            clean_advertiser = strip_html_tags(offer.advertiser_name)
-            safe_advertiser = html.escape(clean_advertiser)
-            all_cards_html += f'<span class="custom-badge badge-primary"><i class="bi bi-building"></i> {safe_advertiser}</span>'
-
-            if offer.category == "Direct Brand":
-                all_cards_html += '<span class="custom-badge badge-success"><i class="bi bi-bullseye"></i> Direct Brand</span>'
-            else:
-                all_cards_html += '<span class="custom-badge badge-info"><i class="bi bi-newspaper"></i> Blog Post</span>'
-
-            if offer.network:
-                clean_network = strip_html_tags(offer.network)
-                safe_network = html.escape(clean_network)
-                all_cards_html += f'<span class="custom-badge badge-warning"><i class="bi bi-diagram-3"></i> {safe_network}</span>'
-
-            all_cards_html += '</div>'
-            all_cards_html += '</div>'  # Close left side
-
-            # Right side: Commission badge + Potential score
-            all_cards_html += '<div style="margin-left: 20px; flex-shrink: 0; display: flex; flex-direction: column; gap: 8px; align-items: flex-end;">'
-
-            # Commission badge
-            if offer.category == "Direct Brand" and offer.commission_value:
-                if offer.commission_type == "Percentage":
-                    all_cards_html += f'<div class="commission-badge"><i class="bi bi-cash-coin"></i> {int(offer.commission_value)}%</div>'
-                elif offer.commission_type == "Fixed":
-                    all_cards_html += f'<div class="commission-badge"><i class="bi bi-currency-dollar"></i> ${int(offer.commission_value)}</div>'
-            else:
-                if offer.category == "Direct Brand":
-                    all_cards_html += '<span class="category-icon">🎯</span>'
-                else:
-                    all_cards_html += '<span class="category-icon">📰</span>'
-
-            all_cards_html += '</div>'
-
-            all_cards_html += '</div>'  # Close flex container
-
-            # Description INSIDE the card (unified with card styling)
-            if offer.description:
-                clean_desc = strip_html_tags(offer.description)
-                desc = clean_desc[:200] + "..." if len(clean_desc) > 200 else clean_desc
-                safe_desc = html.escape(desc)
-                all_cards_html += f'<div style="margin-top: 16px;"><p style="color: #64748b; font-size: 14px; line-height: 1.6; margin: 0;">{safe_desc}</p></div>'
-
-            # Scalability Metrics
-            if offer.scalability_score is not None:
-                all_cards_html += '<div style="margin-top: 16px; padding: 12px; background: linear-gradient(135deg, #f8fafc 0%, #f1f5f9 100%); border-radius: 8px; border-left: 3px solid #3b82f6;">'
-
-                # Scalability score header
-                score_color = "#10b981" if offer.scalability_score >= 75 else "#f59e0b" if offer.scalability_score >= 50 else "#ef4444"
-                all_cards_html += f'<div style="margin-bottom: 10px;"><span style="color: #1e293b; font-size: 13px; font-weight: 700;"><i class="bi bi-graph-up-arrow"></i> Scalability:</span> <span style="color: {score_color}; font-weight: 700; font-size: 14px;">{offer.scalability_score}/100</span></div>'
-
-                # Metrics grid
-                all_cards_html += '<div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 8px; font-size: 11px;">'
-
-                # Row 1
-                if offer.traffic_monthly:
-                    all_cards_html += f'<div style="color: #475569;"><i class="bi bi-globe" style="color: #3b82f6;"></i> Traffic: <span style="font-weight: 600;">{html.escape(offer.traffic_monthly)}</span></div>'
-
-                if offer.cookie_duration:
-                    all_cards_html += f'<div style="color: #475569;"><i class="bi bi-clock" style="color: #8b5cf6;"></i> Cookie: <span style="font-weight: 600;">{offer.cookie_duration} days</span></div>'
-
-                if offer.growth_percentage:
-                    growth_color = "#10b981" if offer.growth_percentage.startswith('+') else "#ef4444"
-                    all_cards_html += f'<div style="color: #475569;"><i class="bi bi-graph-up" style="color: {growth_color};"></i> Growth: <span style="font-weight: 600; color: {growth_color};">{html.escape(offer.growth_percentage)}</span></div>'
-
-                # Row 2
-                if offer.competition_level:
-                    comp_color = "#10b981" if offer.competition_level in ["Low", "Very Low"] else "#f59e0b" if offer.competition_level == "Medium" else "#ef4444"
-                    all_cards_html += f'<div style="color: #475569;"><i class="bi bi-bullseye" style="color: {comp_color};"></i> Competition: <span style="font-weight: 600; color: {comp_color};">{html.escape(offer.competition_level)}</span></div>'
-
-                if offer.domain_authority:
-                    all_cards_html += f'<div style="color: #475569;"><i class="bi bi-award" style="color: #f59e0b;"></i> DA: <span style="font-weight: 600;">{offer.domain_authority}/100</span></div>'
-
-                if offer.instagram_followers:
-                    all_cards_html += f'<div style="color: #475569;"><i class="bi bi-instagram" style="color: #ec4899;"></i> IG: <span style="font-weight: 600;">{html.escape(offer.instagram_followers)}</span></div>'
-
-                all_cards_html += '</div>'  # Close grid
-                all_cards_html += '</div>'  # Close scalability section
-
-            # Related Keywords for SEO
-            if offer.related_keywords and len(offer.related_keywords) > 0:
-                all_cards_html += '<div style="margin-top: 12px; display: flex; flex-wrap: wrap; gap: 6px; align-items: center;">'
-                all_cards_html += '<span style="color: #64748b; font-size: 12px; font-weight: 600; margin-right: 4px;"><i class="bi bi-search"></i> SEO Keywords:</span>'
-
-                for kw_data in offer.related_keywords[:5]:  # Show max 5 keywords
-                    # Handle both dict format (new) and string format (old)
-                    if isinstance(kw_data, dict):
-                        keyword = kw_data.get("keyword", "")
-                        volume = kw_data.get("volume", "")
-                        safe_kw = html.escape(keyword)
-                        safe_vol = html.escape(volume)
-                        all_cards_html += f'<span style="background: #f1f5f9; color: #475569; padding: 4px 10px; border-radius: 8px; font-size: 11px; font-weight: 500;">{safe_kw} <span style="color: #94a3b8;">• {safe_vol}</span></span>'
-                    else:
-                        # Fallback for string format
-                        safe_kw = html.escape(str(kw_data))
-                        all_cards_html += f'<span style="background: #f1f5f9; color: #475569; padding: 4px 10px; border-radius: 8px; font-size: 11px; font-weight: 500;">{safe_kw}</span>'
-
-                all_cards_html += '</div>'
-
-            # Close card HTML
-            if offer.tracking_url:
-                all_cards_html += '</a>'  # Close anchor tag
-            else:
-                all_cards_html += '</div>'  # Close div
-
-        all_cards_html += '</div>'
-
-        # Render all cards in one block
-        st.markdown(all_cards_html, unsafe_allow_html=True)
+        # Results only change when the fetched offers, mode or limit change;
+        # a new result set starts back on the first page
+        results_key = (st.session_state.get('fetch_id', 0), mode, limit)
+        if st.session_state.get('results_key') != results_key:
+            st.session_state.results_key = results_key
+            st.session_state.page = 0
+
+        page_count = (len(offers) + _CARDS_PER_PAGE - 1) // _CARDS_PER_PAGE
+        page = max(0, min(st.session_state.get('page', 0), page_count - 1))
+        first = page * _CARDS_PER_PAGE
+
+        # Reuse the page's card HTML across reruns triggered by unrelated widgets
+        cards_key = results_key + (page,)
+        if st.session_state.get('cards_key') != cards_key:
+            st.session_state.cards_html = _build_offer_cards_html(
+                offers[first:first + _CARDS_PER_PAGE], start=first + 1
+            )
+            st.session_state.cards_key = cards_key
+
+        # Render the page's cards in one block
+        st.markdown(st.session_state.cards_html, unsafe_allow_html=True)
+
+        if page_count > 1:
+            prev_col, info_col, next_col = st.columns([1, 2, 1])
+            with prev_col:
+                st.button("← Previous", on_click=_change_page, args=(-1,),
+                          disabled=page == 0, use_container_width=True)
+            with info_col:
+                last = min(first + _CARDS_PER_PAGE, len(offers))
+                st.markdown(
+                    f'<p style="text-align: center; color: #64748b; font-size: 14px; margin-top: 8px;">'
+                    f'Page {page + 1} of {page_count} · offers {first + 1}–{last} of {len(offers)}</p>',
+                    unsafe_allow_html=True,
+                )
+            with next_col:
+                st.button("Next →", on_click=_change_page, args=(1,),
+                          disabled=page >= page_count - 1, use_container_width=True)
 
         # Export section with Bootstrap styling
         st.markdown('<div style="margin-top: 40px; padding-top: 30px; border-top: 2px solid #e5e7eb;"></div>', unsafe_allow_html=True)
@@ -847,36 +962,21 @@ def main():
             </p>
             """, unsafe_allow_html=True)
 
-        df_data = []
-        for offer in offers:
-            df_data.append({
-                "Name": offer.name,
-                "Advertiser": offer.advertiser_name,
-                "Network": offer.network,
-                "Commission Type": offer.commission_type,
-                "Commission": offer.commission_value,
-                "EPC": offer.epc,
-                "Conv Rate": offer.conversion_rate,
-                "YouTube Score": offer.youtube_score,
-                "Scalability Score": offer.scalability_score,
-                "Traffic": offer.traffic_monthly,
-                "Cookie Duration": offer.cookie_duration,
-                "Growth": offer.growth_percentage,
-                "Competition": offer.competition_level,
-                "Domain Authority": offer.domain_authority,
-                "Instagram": offer.instagram_followers,
-                "Category": offer.category,
-                "Tracking URL": offer.tracking_url
-            })
-
-        df = pd.DataFrame(df_data)
-
-        csv = df.to_csv(index=False).encode('utf-8')
+        # The export covers every result, so serialise it only when the results change
+        if st.session_state.get('export_key') != results_key:
+            buf = io.StringIO()
+            writer = csv.writer(buf, lineterminator='\n')
+            writer.writerow([header for header, _ in _EXPORT_COLUMNS])
+            writer.writerows(
+                [getattr(o, attr) for _, attr in _EXPORT_COLUMNS] for o in offers
+            )
+            st.session_state.export_csv = buf.getvalue().encode('utf-8')
+            st.session_state.export_key = results_key
 
         with col2:
             st.download_button(
                 label="📥 Download CSV",
-                data=csv,
+                data=st.session_state.export_csv,
                 file_name="affiliate_offers.csv",
                 mime="text/csv",
                 use_container_width=True
@@ -907,12 +1007,11 @@ def main():
     # =====================================================================
     if aggregator.sheets_cache:
         # Server-side: check for feedback in query params FIRST (before rendering)
-        import urllib.parse
         params = st.query_params
 
         if params.get("fb_send"):
-            fb_name = urllib.parse.unquote(params.get("fb_name", ""))
-            fb_msg = urllib.parse.unquote(params.get("fb_msg", ""))
+            fb_name = params.get("fb_name", "")
+            fb_msg = params.get("fb_msg", "")
             if fb_msg.strip():
                 try:
                     aggregator.sheets_cache.append_feedback(fb_name, fb_msg)
@@ -924,151 +1023,7 @@ def main():
 
         # Floating bubble injected via components.html (scripts execute here, unlike st.markdown)
         import streamlit.components.v1 as components
-        _fb_user = html.escape(user_name or '')
-        _fb_html = """
-        <script>
-        (function() {
-            var doc = window.parent.document;
-
-            // Only inject once
-            if (doc.getElementById('fb-bubble')) return;
-
-            // Inject styles into parent
-            var style = doc.createElement('style');
-            style.textContent = `
-                #fb-bubble {
-                    position: fixed;
-                    bottom: 24px;
-                    right: 24px;
-                    z-index: 100000;
-                    width: 56px;
-                    height: 56px;
-                    border-radius: 50%;
-                    background: linear-gradient(135deg, #6366f1, #4f46e5);
-                    color: white;
-                    border: none;
-                    font-size: 24px;
-                    cursor: pointer;
-                    box-shadow: 0 4px 16px rgba(99,102,241,0.45);
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    transition: all 0.2s;
-                }
-                #fb-bubble:hover {
-                    transform: scale(1.1);
-                    box-shadow: 0 6px 24px rgba(99,102,241,0.55);
-                }
-                #fb-popup {
-                    display: none;
-                    position: fixed;
-                    bottom: 92px;
-                    right: 24px;
-                    z-index: 100000;
-                    width: 340px;
-                    background: white;
-                    border-radius: 16px;
-                    box-shadow: 0 12px 40px rgba(0,0,0,0.2);
-                    padding: 24px;
-                    border: 1px solid #e5e7eb;
-                }
-                #fb-popup.open { display: block; }
-                #fb-popup h3 {
-                    margin: 0 0 16px;
-                    font-size: 17px;
-                    font-weight: 700;
-                    color: #1e293b;
-                    font-family: -apple-system, BlinkMacSystemFont, sans-serif;
-                }
-                #fb-popup input, #fb-popup textarea {
-                    width: 100%;
-                    padding: 10px 12px;
-                    border: 1px solid #d1d5db;
-                    border-radius: 8px;
-                    font-size: 14px;
-                    font-family: inherit;
-                    margin-bottom: 10px;
-                    box-sizing: border-box;
-                    outline: none;
-                }
-                #fb-popup input:focus, #fb-popup textarea:focus {
-                    border-color: #6366f1;
-                    box-shadow: 0 0 0 3px rgba(99,102,241,0.1);
-                }
-                #fb-popup textarea { height: 80px; resize: vertical; }
-                #fb-send-btn {
-                    width: 100%;
-                    padding: 11px;
-                    background: linear-gradient(135deg, #6366f1, #4f46e5);
-                    color: white;
-                    border: none;
-                    border-radius: 10px;
-                    font-size: 14px;
-                    font-weight: 600;
-                    cursor: pointer;
-                    font-family: inherit;
-                }
-                #fb-send-btn:hover { opacity: 0.9; }
-                #fb-status { margin-top: 8px; font-size: 13px; text-align: center; }
-            `;
-            doc.head.appendChild(style);
-
-            // Create bubble
-            var bubble = doc.createElement('div');
-            bubble.id = 'fb-bubble';
-            bubble.textContent = String.fromCodePoint(0x1F4AC);
-            doc.body.appendChild(bubble);
-
-            // Create popup
-            var popup = doc.createElement('div');
-            popup.id = 'fb-popup';
-            var fbUser = '__FB_USER__';
-            var nameField = fbUser
-                ? '<input type="text" id="fb-name" value="' + fbUser + '" readonly style="background:#f1f5f9;color:#475569;">'
-                : '<input type="text" id="fb-name" placeholder="Your name" required>';
-            popup.innerHTML = '<h3>Feedback</h3>'
-                + nameField
-                + '<textarea id="fb-msg" placeholder="What do you think? Any issues or suggestions?"></textarea>'
-                + '<button id="fb-send-btn">Send Feedback</button>'
-                + '<div id="fb-status"></div>';
-            doc.body.appendChild(popup);
-
-            // Toggle popup on bubble click
-            bubble.addEventListener('click', function() {
-                popup.classList.toggle('open');
-            });
-
-            // Submit feedback
-            doc.getElementById('fb-send-btn').addEventListener('click', function() {
-                var name = doc.getElementById('fb-name').value.trim();
-                var msg = doc.getElementById('fb-msg').value.trim();
-                var status = doc.getElementById('fb-status');
-                if (!name) {
-                    status.innerHTML = '<span style="color:#f59e0b;">Please enter your name</span>';
-                    return;
-                }
-                if (!msg) {
-                    status.innerHTML = '<span style="color:#f59e0b;">Please enter a message</span>';
-                    return;
-                }
-                status.innerHTML = '<span style="color:#6366f1;">Sending...</span>';
-                doc.getElementById('fb-name').value = '';
-                doc.getElementById('fb-msg').value = '';
-                var url = new URL(window.parent.location.href);
-                url.searchParams.set('fb_name', encodeURIComponent(name));
-                url.searchParams.set('fb_msg', encodeURIComponent(msg));
-                url.searchParams.set('fb_send', '1');
-                setTimeout(function() {
-                    status.innerHTML = '<span style="color:#10b981;">&#10003; Sent! Thank you.</span>';
-                    setTimeout(function() {
-                        window.parent.location.href = url.toString();
-                    }, 800);
-                }, 200);
-            });
-        })();
-        </script>
-        """.replace('__FB_USER__', _fb_user)
-        components.html(_fb_html, height=0)
+        components.html(feedback_bubble_html(user_name), height=0)
     # =====================================================================
     # END: Floating Chat Feedback Bubble
     # =====================================================================
@@ -1,10 +1,25 @@
 """Affbank integration for discovering affiliate offers."""
-import requests
+import logging
 from typing import List, Optional
-from networks.base import BaseNetwork
+from networks.base import BaseNetwork, UTF8_HTML_PARSER, element_text
 from models.offer import Offer
 import re
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+# Category tags Affbank prepends to offer names, plus any surrounding or
+# other whitespace run; both collapse to a single space in one pass
+_NAME_CLEAN_RE = re.compile(r'(?:\s*(?:Sponsored|Gambling & betting|Dating|Finance|Sweepstakes))+\s*|\s+')
+_DOLLAR_RE = re.compile(r'\$(\d+(?:\.\d{2})?)')
+_PCT_RE = re.compile(r'(\d+)%')
+
+# XPath expressions compiled once at import
+_TABLE_XP = etree.XPath('(//table)[1]')
+_ROW_XP = etree.XPath('.//tr')
+_CELL_XP = etree.XPath('.//td | .//th')
+_LINK_XP = etree.XPath('(.//a)[1]')
 
 
 class AffbankNetwork(BaseNetwork):
@@ -15,8 +30,7 @@ class AffbankNetwork(BaseNetwork):
     def __init__(self):
         """Initialize Affbank scraper."""
         super().__init__()
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.session = self._create_session({
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
         })
@@ -59,74 +73,74 @@ class AffbankNetwork(BaseNetwork):
             else:
                 url = f"{self.BASE_URL}/offers/"
 
-            print(f"Scraping Affbank: {url}")
+            logger.info("Scraping Affbank: %s", url)
 
             response = self.session.get(url, timeout=10)
 
             if response.status_code != 200:
-                print(f"Affbank returned status {response.status_code}")
+                logger.warning("Affbank returned status %s", response.status_code)
                 return []
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            tree = lxml.html.fromstring(response.content, parser=UTF8_HTML_PARSER)
 
             # Find the main offers table
-            table = soup.find('table')
+            tables = _TABLE_XP(tree)
 
-            if not table:
-                print("No table found on Affbank")
+            if not tables:
+                logger.warning("No table found on Affbank")
                 return []
 
             # Get all offer rows (skip header row)
-            rows = table.find_all('tr')[1:]  # Skip header
+            rows = _ROW_XP(tables[0])[1:]  # Skip header
 
-            print(f"Found {len(rows)} offers on Affbank")
+            logger.info("Found %d offers on Affbank", len(rows))
 
             for idx, row in enumerate(rows[:limit], 1):
                 try:
-                    cells = row.find_all(['td', 'th'])
+                    cells = _CELL_XP(row)
 
                     if len(cells) < 4:
                         continue
 
                     # Cell 0: Offer name
                     name_cell = cells[0]
-                    name_link = name_cell.find('a')
+                    name_links = _LINK_XP(name_cell)
 
-                    if not name_link:
+                    if not name_links:
                         continue
 
-                    offer_name = name_link.get_text(strip=True)
+                    name_link = name_links[0]
+                    offer_name = element_text(name_link)
                     offer_path = name_link.get('href', '')
                     offer_url = f"{self.BASE_URL}{offer_path}" if offer_path.startswith('/') else offer_path
 
                     # Extract category from name (e.g., "PIN-UP Casino - EC CPA")
                     # Clean up category tags like "Sponsored", "Gambling & betting"
-                    clean_name = re.sub(r'(Sponsored|Gambling & betting|Dating|Finance|Sweepstakes)', '', offer_name)
-                    clean_name = re.sub(r'\s+', ' ', clean_name).strip()
+                    clean_name = _NAME_CLEAN_RE.sub(' ', offer_name).strip()
 
                     # Cell 1: Network
                     network_cell = cells[1]
-                    network_link = network_cell.find('a')
-                    network_name = network_link.get_text(strip=True) if network_link else "Unknown"
+                    network_links = _LINK_XP(network_cell)
+                    network_name = element_text(network_links[0]) if network_links else "Unknown"
 
                     # Cell 2: Country
-                    country = cells[2].get_text(strip=True) if len(cells) > 2 else ""
+                    country = element_text(cells[2]) if len(cells) > 2 else ""
 
                     # Cell 3: Payout
-                    payout_text = cells[3].get_text(strip=True) if len(cells) > 3 else ""
+                    payout_text = element_text(cells[3]) if len(cells) > 3 else ""
 
                     # Parse payout
                     commission_type = "CPA"
                     commission_value = None
 
                     # Check for dollar amount
-                    dollar_match = re.search(r'\$(\d+(?:\.\d{2})?)', payout_text)
+                    dollar_match = _DOLLAR_RE.search(payout_text)
                     if dollar_match:
                         commission_value = float(dollar_match.group(1))
                         commission_type = "Fixed"
                     else:
                         # Check for percentage
-                        pct_match = re.search(r'(\d+)%', payout_text)
+                        pct_match = _PCT_RE.search(payout_text)
                         if pct_match:
                             commission_value = float(pct_match.group(1))
                             commission_type = "Percentage"
@@ -148,8 +162,9 @@ class AffbankNetwork(BaseNetwork):
                         if keyword_lower not in searchable_text:
                             continue
 
+                    # Values are already typed here, so skip pydantic validation
                     offers.append(
-                        Offer(
+                        Offer.model_construct(
                             id=f"affbank-{idx}",
                             name=clean_name,
                             description=description,
@@ -167,13 +182,13 @@ class AffbankNetwork(BaseNetwork):
                     )
 
                 except Exception as e:
-                    print(f"Error parsing Affbank offer {idx}: {e}")
+                    logger.debug("Error parsing Affbank offer %d: %s", idx, e)
                     continue
 
-            print(f"Successfully scraped {len(offers)} offers from Affbank")
+            logger.info("Successfully scraped %d offers from Affbank", len(offers))
 
         except Exception as e:
-            print(f"Error scraping Affbank: {e}")
+            logger.error("Error scraping Affbank: %s", e)
 
         return offers
 
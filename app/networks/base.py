@@ -1,8 +1,23 @@
 """Base class for affiliate network integrations."""
 from abc import ABC, abstractmethod
 from typing import List, Optional
+import lxml.html
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from models.offer import Offer
 
+# Parser for sites known to serve UTF-8, so response bytes can be parsed directly
+UTF8_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+
+def element_text(el) -> str:
+    """Text of an element with each fragment stripped (like BeautifulSoup's get_text(strip=True))."""
+    if len(el) == 0:
+        # Leaf element (most cells and links): its own text is all there is
+        return (el.text or "").strip()
+    return "".join(t.strip() for t in el.itertext())
+
 
 class BaseNetwork(ABC):
     """Abstract base class for affiliate network APIs."""
@@ -11,6 +26,30 @@ class BaseNetwork(ABC):
         """Initialize the network client."""
         self.network_name = self.__class__.__name__.replace("Network", "").lower()
 
+    @staticmethod
+    def _create_session(headers: dict) -> requests.Session:
+        """
+        Create an HTTP session with a keep-alive connection pool and connect retries.
+
+        Args:
+            headers: Default headers sent with every request
+
+        Returns:
+            Configured requests.Session
+        """
+        session = requests.Session()
+        session.headers.update(headers)
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            # Retry failed connects only: a read timeout means the server is
+            # slow, and retrying would multiply callers' short timeouts
+            max_retries=Retry(total=3, connect=3, read=0, backoff_factor=0.3),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
     @abstractmethod
     def search_offers(
         self,
@@ -55,3 +94,7 @@ class BaseNetwork(ABC):
             True if connection successful, False otherwise
         """
         pass
+
+    def clear_cache(self) -> None:
+        """Drop any in-memory response caches (called on a forced refresh)."""
+        pass
@@ -1,10 +1,19 @@
 """Impact.com API integration."""
-import requests
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from typing import List, Optional
+import orjson
 from networks.base import BaseNetwork
 from models.offer import Offer
 from config import Config
 
+logger = logging.getLogger(__name__)
+
+# Contract terms can change; refetch after a day like the Sheets cache
+_CONTRACT_TTL = 24 * 60 * 60
+
 
 class ImpactNetwork(BaseNetwork):
     """Impact.com affiliate network integration."""
@@ -16,12 +25,13 @@ class ImpactNetwork(BaseNetwork):
         super().__init__()
         self.account_sid = Config.IMPACT_ACCOUNT_SID
         self.auth_token = Config.IMPACT_AUTH_TOKEN
-        self.session = requests.Session()
-        self.session.auth = (self.account_sid, self.auth_token)
-        self.session.headers.update({
+        self.session = self._create_session({
             "Accept": "application/json",
             "Content-Type": "application/json"
         })
+        self.session.auth = (self.account_sid, self.auth_token)
+        # (fetched_at, contract JSON) by ContractUri; campaigns of one program share a contract
+        self._contract_cache: dict = {}
 
     def test_connection(self) -> bool:
         """Test API credentials."""
@@ -33,7 +43,7 @@ class ImpactNetwork(BaseNetwork):
             )
             return response.status_code == 200
         except Exception as e:
-            print(f"Impact API connection failed: {e}")
+            logger.error("Impact API connection failed: %s", e)
             return False
 
     def search_offers(
@@ -63,15 +73,15 @@ class ImpactNetwork(BaseNetwork):
             )
 
             if response.status_code != 200:
-                print(f"Impact API error: {response.status_code} - {response.text}")
+                logger.error("Impact API error: %s - %s", response.status_code, response.text)
                 return []
 
-            data = response.json()
+            data = orjson.loads(response.content)
             campaigns = data.get("Campaigns", [])
 
-            print(f"Impact API: Found {len(campaigns)} campaigns")
+            logger.info("Impact API: Found %d campaigns", len(campaigns))
 
-            offers = []
+            candidates = []
             for campaign in campaigns:
                 # Filter by keyword if provided
                 if keyword:
@@ -82,25 +92,32 @@ class ImpactNetwork(BaseNetwork):
 
                 offer = self._parse_campaign_to_offer(campaign)
 
-                # Fetch commission details from contract
-                self._add_contract_details(offer, campaign)
-
-                # Filter by min EPC if provided
+                # Filter by min EPC if provided (EPC comes from campaign stats,
+                # so this runs before paying for the contract request)
                 if min_epc and (not offer.epc or offer.epc < min_epc):
                     continue
 
+                candidates.append((offer, campaign))
+
+            # Fetch commission details from contracts concurrently (one GET each)
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                list(executor.map(lambda pair: self._add_contract_details(*pair), candidates))
+
+            offers = []
+            for offer, _ in candidates:
                 offer.calculate_youtube_score()
                 offers.append(offer)
 
-            # Sort by YouTube score (highest first)
-            offers.sort(key=lambda x: x.youtube_score or 0, reverse=True)
+            # Sort by YouTube score (highest first); every offer was just scored,
+            # so the score is always a float
+            offers.sort(key=attrgetter("youtube_score"), reverse=True)
 
-            print(f"Impact API: Returning {len(offers)} offers after filtering")
+            logger.info("Impact API: Returning %d offers after filtering", len(offers))
 
             return offers
 
         except Exception as e:
-            print(f"Error searching Impact offers: {e}")
+            logger.error("Error searching Impact offers: %s", e)
             return []
 
     def get_offer_details(self, offer_id: str) -> Optional[Offer]:
@@ -113,16 +130,20 @@ class ImpactNetwork(BaseNetwork):
             if response.status_code != 200:
                 return None
 
-            campaign = response.json()
+            campaign = orjson.loads(response.content)
             offer = self._parse_campaign_to_offer(campaign)
             offer.calculate_youtube_score()
 
             return offer
 
         except Exception as e:
-            print(f"Error fetching Impact campaign {offer_id}: {e}")
+            logger.error("Error fetching Impact campaign %s: %s", offer_id, e)
             return None
 
+    def clear_cache(self) -> None:
+        """Forget cached contracts so the next search refetches commission terms."""
+        self._contract_cache.clear()
+
     def _add_contract_details(self, offer: Offer, campaign: dict) -> None:
         """
         Fetch and add contract details (commission info) to an offer.
@@ -137,13 +158,19 @@ class ImpactNetwork(BaseNetwork):
             if not contract_uri:
                 return
 
-            # Fetch contract details
-            response = self.session.get(f"{self.BASE_URL}{contract_uri}")
+            # Fetch contract details (once per contract URI)
+            now = time.monotonic()
+            cached = self._contract_cache.get(contract_uri)
+            if cached is not None and now - cached[0] < _CONTRACT_TTL:
+                contract = cached[1]
+            else:
+                response = self.session.get(f"{self.BASE_URL}{contract_uri}")
 
-            if response.status_code != 200:
-                return
+                if response.status_code != 200:
+                    return
 
-            contract = response.json()
+                contract = orjson.loads(response.content)
+                self._contract_cache[contract_uri] = (now, contract)
 
             # Extract event payouts (commission structure)
             terms = contract.get("Terms", {})
@@ -181,7 +208,7 @@ class ImpactNetwork(BaseNetwork):
 
         except Exception as e:
             # Silent fail - just continue without contract data
-            print(f"Could not fetch contract for {offer.name}: {e}")
+            logger.debug("Could not fetch contract for %s: %s", offer.name, e)
 
     def _parse_campaign_to_offer(self, campaign: dict) -> Offer:
         """Convert Impact campaign to standardized Offer model."""
@@ -1,12 +1,27 @@
 """Impact.com marketplace scraper — discover programs to apply to."""
-import requests
+import logging
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
-from bs4 import BeautifulSoup
-from networks.base import BaseNetwork
+import lxml.html
+from lxml import etree
+from networks.base import BaseNetwork, UTF8_HTML_PARSER, element_text
 from models.offer import Offer
 
+logger = logging.getLogger(__name__)
+
+# Directory pages are fetched a few at a time with a pause between bursts, so
+# an early stop saves the remaining requests and affi.io isn't hammered
+_PAGE_BATCH = 3
+_BATCH_DELAY = 0.5
+
+# XPath expressions compiled once at import
+_TABLE_XP = etree.XPath("(//table)[1]")
+_ROW_XP = etree.XPath(".//tr")
+_CELL_XP = etree.XPath(".//td")
+_LINK_XP = etree.XPath("(.//a)[1]")
+
 
 class ImpactMarketplaceNetwork(BaseNetwork):
     """Scrape the affi.io directory for Impact.com affiliate programs."""
@@ -16,8 +31,7 @@ class ImpactMarketplaceNetwork(BaseNetwork):
     def __init__(self):
         super().__init__()
         self.network_name = "impact_marketplace"
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.session = self._create_session({
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
             "Accept": "text/html,application/xhtml+xml",
         })
@@ -45,40 +59,23 @@ class ImpactMarketplaceNetwork(BaseNetwork):
         pages_needed = max(1, (limit + 49) // 50)  # 50 per page
         pages_needed = min(pages_needed, 10)  # cap at 10 pages (500 programs)
 
-        for page in range(1, pages_needed + 1):
-            try:
-                url = f"{self.DIRECTORY_URL}?page={page}"
-                print(f"Impact Marketplace: Scraping page {page}...")
-                r = self.session.get(url, timeout=15)
-                if r.status_code != 200:
-                    break
-
-                programs = self._parse_directory_page(r.text)
-                if not programs:
-                    break
-
-                all_programs.extend(programs)
-                print(f"  Page {page}: {len(programs)} programs (total: {len(all_programs)})")
+        # Keyword filtering happens while parsing, so only matches are kept
+        kw = keyword.lower() if keyword else None
 
-                if len(all_programs) >= limit:
-                    break
+        # Take pages in order up to the first failed or empty page, or the limit
+        for page, programs in self._iter_pages(pages_needed, kw):
+            if programs is None:
+                break
 
-                if page < pages_needed:
-                    time.sleep(0.5)
+            all_programs.extend(programs)
+            logger.debug("  Page %d: %d programs (total: %d)", page, len(programs), len(all_programs))
 
-            except Exception as e:
-                print(f"Error scraping page {page}: {e}")
+            if len(all_programs) >= limit:
                 break
 
-        # Filter by keyword if provided
-        if keyword:
-            kw = keyword.lower()
-            all_programs = [p for p in all_programs if kw in p["name"].lower()]
-
-        # Convert to Offer objects
-        offers = []
-        for idx, prog in enumerate(all_programs[:limit], 1):
-            offers.append(Offer(
+        # Convert to Offer objects (values are already typed, so skip validation)
+        offers = [
+            Offer.model_construct(
                 id=f"impact-mp-{prog['slug']}",
                 name=prog["name"],
                 description=f"Impact.com affiliate program. Apply at impact.com to promote {prog['name']}.",
@@ -90,9 +87,11 @@ class ImpactMarketplaceNetwork(BaseNetwork):
                 category="Direct Brand",
                 tracking_url=f"https://app.impact.com/campaign-mediapartner-signup/{prog['slug']}.brand",
                 landing_page_url=prog.get("website"),
-            ))
+            )
+            for prog in all_programs[:limit]
+        ]
 
-        print(f"Impact Marketplace: Returning {len(offers)} programs")
+        logger.info("Impact Marketplace: Returning %d programs", len(offers))
         return offers
 
     def get_offer_details(self, offer_id: str) -> Optional[Offer]:
@@ -102,33 +101,68 @@ class ImpactMarketplaceNetwork(BaseNetwork):
     # Parsing
     # ------------------------------------------------------------------
 
-    def _parse_directory_page(self, html_text: str) -> list:
-        """Parse a single page of the affi.io directory table."""
-        soup = BeautifulSoup(html_text, "html.parser")
-        table = soup.find("table")
-        if not table:
-            return []
+    def _iter_pages(self, pages_needed: int, keyword_lower: Optional[str] = None):
+        """Yield (page, programs) in page order, fetching _PAGE_BATCH pages concurrently at a time."""
+        with ThreadPoolExecutor(max_workers=min(_PAGE_BATCH, pages_needed)) as executor:
+            for first in range(1, pages_needed + 1, _PAGE_BATCH):
+                if first > 1:
+                    time.sleep(_BATCH_DELAY)
+                batch = range(first, min(first + _PAGE_BATCH, pages_needed + 1))
+                yield from zip(batch, executor.map(lambda page: self._fetch_page(page, keyword_lower), batch))
+
+    def _fetch_page(self, page: int, keyword_lower: Optional[str] = None) -> Optional[list]:
+        """Fetch and parse one directory page; None if the request fails or the page is empty."""
+        try:
+            url = f"{self.DIRECTORY_URL}?page={page}"
+            logger.debug("Impact Marketplace: Scraping page %d...", page)
+            r = self.session.get(url, timeout=15)
+            if r.status_code != 200:
+                return None
+            return self._parse_directory_page(r.content, keyword_lower)
+        except Exception as e:
+            logger.warning("Error scraping page %d: %s", page, e)
+            return None
+
+    def _parse_directory_page(self, html_bytes: bytes, keyword_lower: Optional[str] = None) -> Optional[list]:
+        """
+        Parse a single page of the affi.io directory table.
+
+        Returns the open programs whose name contains keyword_lower (all open
+        programs if None), or None when the page has no table rows (past the end).
+        """
+        tree = lxml.html.fromstring(html_bytes, parser=UTF8_HTML_PARSER)
+        tables = _TABLE_XP(tree)
+        if not tables:
+            return None
+
+        rows = _ROW_XP(tables[0])[1:]  # skip header
+        if not rows:
+            return None
 
         programs = []
-        for row in table.find_all("tr")[1:]:  # skip header
-            cells = row.find_all("td")
+        for row in rows:
+            cells = _CELL_XP(row)
             if len(cells) < 4:
                 continue
 
             # Column 1: name + link
-            link = cells[1].find("a")
-            if not link:
+            links = _LINK_XP(cells[1])
+            if not links:
+                continue
+
+            link = links[0]
+            name = element_text(link)
+            if keyword_lower and keyword_lower not in name.lower():
                 continue
 
-            name = link.get_text(strip=True)
             href = link.get("href", "")
             slug = href.replace("/m/", "").strip("/") if "/m/" in href else name.lower().replace(" ", "-")
 
             # Column 2: country
-            country = cells[2].get_text(strip=True)
+            country = element_text(cells[2])
 
             # Column 3: status
-            status = cells[3].get_text(strip=True)
+            status = element_text(cells[3])
             if status.lower() != "opened":
                 continue  # skip closed/paused
 
@@ -1,15 +1,104 @@
 """OfferVault integration for discovering new affiliate offers."""
-import requests
+import logging
 from typing import List, Optional, Tuple
-from networks.base import BaseNetwork
+from networks.base import BaseNetwork, element_text
 from models.offer import Offer
 from config import Config
 import json
 import re
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 import time
 from serpapi import GoogleSearch
 
+logger = logging.getLogger(__name__)
+
+# Commission callouts sit near the top of the page; don't download or parse past this
+_MAX_DETAIL_BYTES = 256 * 1024
+
+# Commission patterns for affiliate landing pages, compiled once at import.
+# Each context regex fuses its alternatives so the page text is scanned once;
+# exactly one group captures the amount, and its index (match.lastindex) is
+# the alternative's priority, most specific first. The bare fallbacks are a
+# last resort.
+_DOLLAR_CTX_RE = re.compile(
+    r'earn\s+\$(\d+)'  # "earn $150"
+    r'|\$(\d+)\s+(?:per|for|commission)'  # "$150 per customer", "$150 commission"
+    r'|(?:commission|payout|earn|get paid)\s+(?:of|is)?\s*\$(\d+)'  # "commission of $150"
+    r'|\$(\d+)\s+(?:per\s+)?(?:sale|customer|referral|signup)',  # "$150 per sale"
+    re.IGNORECASE
+)
+_PCT_CTX_RE = re.compile(
+    r'earn\s+(\d+)%'  # "earn 25%"
+    r'|(\d+)%\s+commission'  # "25% commission"
+    r'|commission\s+(?:of|is)?\s*(\d+)%'  # "commission of 25%"
+    r'|(\d+)%\s+(?:on|per)',  # "25% on sales"
+    re.IGNORECASE
+)
+_DOLLAR_FALLBACK_RE = re.compile(r'\$(\d+)')
+_PCT_RE = re.compile(r'(\d+)%')
+
+# OfferVault listing cells
+_NETWORK_LABEL_RE = re.compile(r'Network:', re.I)
+_NETWORK_PREFIX_RE = re.compile(r'Network:\s*', re.I)
+_PAYOUT_TEXT_RE = re.compile(r'\$\d+')
+_PAYOUT_RE = re.compile(r'\$(\d+(?:\.\d{2})?)')
+
+# SerpAPI result classification
+_DOMAIN_RE = re.compile(r'https?://(?:www\.)?([^/]+)')
+_DIRECT_BRAND_RE = re.compile(r'/(affiliate|partner|associates|referral)')
+_NUM_LISTICLE_RE = re.compile(r'\d+\s+(best|top|great|affiliate)')
+
+
+def _best_ctx_amount(pattern, text: str, is_valid) -> Optional[float]:
+    """Valid amount from the highest-priority alternative of pattern found in text (one scan)."""
+    best_alt, best_value = None, None
+    for match in pattern.finditer(text):
+        alt = match.lastindex
+        if best_alt is not None and alt >= best_alt:
+            continue
+        value = float(match.group(alt))
+        if is_valid(value):
+            best_alt, best_value = alt, value
+            if alt == 1:
+                break
+    return best_value
+
+
+def _xp(tag: str, cls: Optional[str] = None, first: bool = True) -> etree.XPath:
+    """Compile a descendant XPath for tag (optionally with a class token), first match only by default."""
+    path = f".//{tag}"
+    if cls:
+        path += f"[contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')]"
+    return etree.XPath(f"({path})[1]" if first else path)
+
+
+# Listing selectors in fallback order: the first one that matches wins
+_OFFER_ROW_XPS = (_xp('tr', 'offer-row', False), _xp('div', 'offer-item', False), _xp('div', 'offer-card', False))
+_NAME_XPS = (_xp('a', 'offer-name'), _xp('td', 'name'), _xp('h3'), _xp('a'))
+_NETWORK_XPS = (_xp('td', 'network'), _xp('span', 'network'))
+_PAYOUT_XPS = (_xp('td', 'payout'), _xp('span', 'payout'))
+_CATEGORY_XPS = (_xp('td', 'category'), _xp('span', 'category'))
+_DESC_XPS = (_xp('td', 'description'), _xp('p', 'description'))
+_TEXT_NODES_XP = etree.XPath('.//text()')
+
+
+def _first(el, xpaths):
+    """First element matched by the earliest xpath that matches anything, or None."""
+    for xpath in xpaths:
+        found = xpath(el)
+        if found:
+            return found[0]
+    return None
+
+
+def _find_text(el, pattern) -> Optional[str]:
+    """First descendant text node matching pattern, stripped."""
+    for node in _TEXT_NODES_XP(el):
+        if pattern.search(node):
+            return node.strip()
+    return None
+
 
 class OfferVaultNetwork(BaseNetwork):
     """OfferVault affiliate offer discovery."""
@@ -19,8 +108,7 @@ class OfferVaultNetwork(BaseNetwork):
     def __init__(self):
         """Initialize OfferVault scraper."""
         super().__init__()
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.session = self._create_session({
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
             "Accept": "application/json, text/plain, */*",
             "Referer": "https://offervault.com/"
@@ -44,51 +132,36 @@ class OfferVaultNetwork(BaseNetwork):
         - commission_value: Numeric value
         """
         try:
-            # Very short timeout for speed
-            response = self.session.get(url, timeout=2)
-            if response.status_code != 200:
+            # Very short timeout for speed; stream so only the head of the page is read
+            with self.session.get(url, timeout=2, stream=True) as response:
+                if response.status_code != 200:
+                    return None, None, None
+                html_bytes = response.raw.read(_MAX_DETAIL_BYTES, decode_content=True)
+
+            if not html_bytes:
                 return None, None, None
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            tree = lxml.html.fromstring(html_bytes)
 
-            # Get all text content
-            text = soup.get_text(separator=' ', strip=True)
+            # Get all visible text content (script/style bodies aren't page copy)
+            etree.strip_elements(tree, 'script', 'style', with_tail=False)
+            text = ' '.join(filter(None, (t.strip() for t in tree.itertext())))
 
             # Context-aware patterns: Look for commission-specific dollar amounts first
             # These patterns prioritize context like "earn", "commission", "per customer"
-            dollar_context_patterns = [
-                r'earn\s+\$(\d+)',  # "earn $150"
-                r'\$(\d+)\s+(?:per|for|commission)',  # "$150 per customer", "$150 commission"
-                r'(?:commission|payout|earn|get paid)\s+(?:of|is)?\s*\$(\d+)',  # "commission of $150"
-                r'\$(\d+)\s+(?:per\s+)?(?:sale|customer|referral|signup)',  # "$150 per sale"
-            ]
-
-            for pattern in dollar_context_patterns:
-                dollar_match = re.search(pattern, text, re.IGNORECASE)
-                if dollar_match:
-                    dollar_value = float(dollar_match.group(1))
-                    if dollar_value >= 10:  # Filter out small amounts
-                        badge = f"Earn ${int(dollar_value)}"
-                        return badge, "Fixed", dollar_value
+            dollar_value = _best_ctx_amount(_DOLLAR_CTX_RE, text, lambda v: v >= 10)  # Filter out small amounts
+            if dollar_value is not None:
+                badge = f"Earn ${int(dollar_value)}"
+                return badge, "Fixed", dollar_value
 
             # Context-aware patterns: Look for commission-specific percentages
-            pct_context_patterns = [
-                r'earn\s+(\d+)%',  # "earn 25%"
-                r'(\d+)%\s+commission',  # "25% commission"
-                r'commission\s+(?:of|is)?\s*(\d+)%',  # "commission of 25%"
-                r'(\d+)%\s+(?:on|per)',  # "25% on sales"
-            ]
-
-            for pattern in pct_context_patterns:
-                pct_match = re.search(pattern, text, re.IGNORECASE)
-                if pct_match:
-                    pct_value = float(pct_match.group(1))
-                    if 1 <= pct_value <= 100:  # Reasonable commission range
-                        badge = f"Earn {int(pct_value)}%"
-                        return badge, "Percentage", pct_value
+            pct_value = _best_ctx_amount(_PCT_CTX_RE, text, lambda v: 1 <= v <= 100)  # Reasonable commission range
+            if pct_value is not None:
+                badge = f"Earn {int(pct_value)}%"
+                return badge, "Percentage", pct_value
 
             # Fallback: Look for any dollar amount (if no context-specific patterns found)
-            dollar_fallback = re.search(r'\$(\d+)', text)
+            dollar_fallback = _DOLLAR_FALLBACK_RE.search(text)
             if dollar_fallback:
                 dollar_value = float(dollar_fallback.group(1))
                 if dollar_value >= 10:  # Filter out small amounts
@@ -96,7 +169,7 @@ class OfferVaultNetwork(BaseNetwork):
                     return badge, "Fixed", dollar_value
 
             # Fallback: Look for any percentage (last resort)
-            pct_fallback = re.search(r'(\d+)%', text)
+            pct_fallback = _PCT_RE.search(text)
             if pct_fallback:
                 pct_value = float(pct_fallback.group(1))
                 if 1 <= pct_value <= 100:  # Reasonable commission range
@@ -106,7 +179,7 @@ class OfferVaultNetwork(BaseNetwork):
             return None, None, None
 
         except Exception as e:
-            print(f"Error extracting details from {url}: {e}")
+            logger.debug("Error extracting details from %s: %s", url, e)
             return None, None, None
 
     def search_offers(
@@ -129,27 +202,27 @@ class OfferVaultNetwork(BaseNetwork):
 
         try:
             # Method 1: Try direct OfferVault scraping first
-            print("Method 1: Trying direct OfferVault scraping...")
+            logger.info("Method 1: Trying direct OfferVault scraping...")
             ov_offers = self._scrape_offervault_direct(keyword, limit)
 
             if ov_offers and len(ov_offers) >= 10:
-                print(f"✓ Success! Got {len(ov_offers)} offers from OfferVault directly")
+                logger.info("✓ Success! Got %d offers from OfferVault directly", len(ov_offers))
                 return ov_offers
 
             # Method 2: Try SerpAPI for Google search results
-            print("Method 2: Trying SerpAPI Google search...")
+            logger.info("Method 2: Trying SerpAPI Google search...")
             serp_offers = self._scrape_affiliate_programs(keyword, limit)
 
             if serp_offers and len(serp_offers) >= 5:
-                print(f"✓ Success! Got {len(serp_offers)} offers from SerpAPI")
+                logger.info("✓ Success! Got %d offers from SerpAPI", len(serp_offers))
                 return serp_offers
 
             # Method 3: Fallback to discovery offers
-            print("Method 3: Using discovery offers as fallback")
+            logger.info("Method 3: Using discovery offers as fallback")
             return self._create_discovery_offers(keyword, limit)
 
         except Exception as e:
-            print(f"OfferVault search error: {e}")
+            logger.error("OfferVault search error: %s", e)
             return self._create_discovery_offers(keyword, limit)
 
     def _scrape_offervault_direct(self, keyword: str, limit: int = 50) -> List[Offer]:
@@ -169,23 +242,25 @@ class OfferVaultNetwork(BaseNetwork):
             # OfferVault search URL format
             search_url = f"{self.BASE_URL}/search/?query={keyword}"
 
-            print(f"Scraping OfferVault directly: {search_url}")
+            logger.info("Scraping OfferVault directly: %s", search_url)
 
             response = self.session.get(search_url, timeout=10)
 
             if response.status_code != 200:
-                print(f"OfferVault returned status {response.status_code}")
+                logger.warning("OfferVault returned status %s", response.status_code)
                 return []
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            tree = lxml.html.fromstring(response.content)
 
             # Find offer listings - OfferVault typically uses table rows or card divs
             # We need to inspect their HTML structure
-            offer_rows = soup.find_all('tr', class_='offer-row') or \
-                        soup.find_all('div', class_='offer-item') or \
-                        soup.find_all('div', class_='offer-card')
+            offer_rows = []
+            for xpath in _OFFER_ROW_XPS:
+                offer_rows = xpath(tree)
+                if offer_rows:
+                    break
 
-            print(f"Found {len(offer_rows)} offer listings")
+            logger.info("Found %d offer listings", len(offer_rows))
 
             for idx, row in enumerate(offer_rows[:limit], 1):
                 try:
@@ -193,15 +268,12 @@ class OfferVaultNetwork(BaseNetwork):
                     # This will need to be adjusted based on OfferVault's actual HTML structure
 
                     # Try to find offer name
-                    name_elem = row.find('a', class_='offer-name') or \
-                               row.find('td', class_='name') or \
-                               row.find('h3') or \
-                               row.find('a')
+                    name_elem = _first(row, _NAME_XPS)
 
-                    if not name_elem:
+                    if name_elem is None:
                         continue
 
-                    offer_name = name_elem.get_text(strip=True)
+                    offer_name = element_text(name_elem)
                     offer_url = name_elem.get('href', '')
 
                     # Make URL absolute if relative
@@ -209,47 +281,46 @@ class OfferVaultNetwork(BaseNetwork):
                         offer_url = f"{self.BASE_URL}{offer_url}"
 
                     # Extract network
-                    network_elem = row.find('td', class_='network') or \
-                                  row.find('span', class_='network') or \
-                                  row.find(text=re.compile(r'Network:', re.I))
+                    network_elem = _first(row, _NETWORK_XPS)
 
-                    network_name = network_elem.get_text(strip=True) if network_elem else "Unknown"
-                    network_name = re.sub(r'Network:\s*', '', network_name, flags=re.I)
+                    if network_elem is not None:
+                        network_name = element_text(network_elem)
+                    else:
+                        network_name = _find_text(row, _NETWORK_LABEL_RE) or "Unknown"
+                    network_name = _NETWORK_PREFIX_RE.sub('', network_name)
 
                     # Extract payout/commission
-                    payout_elem = row.find('td', class_='payout') or \
-                                 row.find('span', class_='payout') or \
-                                 row.find(text=re.compile(r'\$\d+'))
+                    payout_elem = _first(row, _PAYOUT_XPS)
+                    if payout_elem is not None:
+                        payout_text = element_text(payout_elem)
+                    else:
+                        payout_text = _find_text(row, _PAYOUT_TEXT_RE)
 
                     commission_type = "CPA"
                     commission_value = None
 
-                    if payout_elem:
-                        payout_text = payout_elem.get_text(strip=True) if hasattr(payout_elem, 'get_text') else str(payout_elem)
-
+                    if payout_text:
                         # Extract dollar amount
-                        dollar_match = re.search(r'\$(\d+(?:\.\d{2})?)', payout_text)
+                        dollar_match = _PAYOUT_RE.search(payout_text)
                         if dollar_match:
                             commission_value = float(dollar_match.group(1))
                             commission_type = "Fixed"
                         else:
                             # Extract percentage
-                            pct_match = re.search(r'(\d+)%', payout_text)
+                            pct_match = _PCT_RE.search(payout_text)
                             if pct_match:
                                 commission_value = float(pct_match.group(1))
                                 commission_type = "Percentage"
 
                     # Extract category
-                    category_elem = row.find('td', class_='category') or \
-                                   row.find('span', class_='category')
+                    category_elem = _first(row, _CATEGORY_XPS)
 
-                    offer_category = category_elem.get_text(strip=True) if category_elem else keyword
+                    offer_category = element_text(category_elem) if category_elem is not None else keyword
 
                     # Extract description if available
-                    desc_elem = row.find('td', class_='description') or \
-                               row.find('p', class_='description')
+                    desc_elem = _first(row, _DESC_XPS)
 
-                    description = desc_elem.get_text(strip=True) if desc_elem else \
+                    description = element_text(desc_elem) if desc_elem is not None else \
                                  f"Affiliate offer from {network_name} in the {offer_category} category"
 
                     offers.append(
@@ -271,13 +342,13 @@ class OfferVaultNetwork(BaseNetwork):
                     )
 
                 except Exception as e:
-                    print(f"Error parsing offer {idx}: {e}")
+                    logger.debug("Error parsing OfferVault offer %d: %s", idx, e)
                     continue
 
-            print(f"Successfully scraped {len(offers)} offers from OfferVault")
+            logger.info("Successfully scraped %d offers from OfferVault", len(offers))
 
         except Exception as e:
-            print(f"Error scraping OfferVault directly: {e}")
+            logger.error("Error scraping OfferVault directly: %s", e)
 
         return offers
 
@@ -291,14 +362,14 @@ class OfferVaultNetwork(BaseNetwork):
 
         # Check if SerpAPI is configured
         if not Config.is_serpapi_configured():
-            print("SerpAPI not configured - falling back to discovery offers")
+            logger.info("SerpAPI not configured - falling back to discovery offers")
             return []
 
         # Automatically search for affiliate programs based on keyword
         # User types niche (e.g., "software"), we search for "software affiliate program"
         query = f"{keyword} affiliate program"
 
-        print(f"Discovery: Searching Google for '{query}' via SerpAPI...")
+        logger.info("Discovery: Searching Google for '%s' via SerpAPI...", query)
 
         try:
             # Use pagination to get more results
@@ -321,12 +392,12 @@ class OfferVaultNetwork(BaseNetwork):
                 results = search.get_dict()
 
                 if page == 0:
-                    print(f"SerpAPI Response: {results.get('search_metadata', {}).get('status', 'unknown')}")
+                    logger.info("SerpAPI Response: %s", results.get('search_metadata', {}).get('status', 'unknown'))
 
                 organic_results = results.get("organic_results", [])
                 all_organic_results.extend(organic_results)
 
-                print(f"Page {page + 1}: Found {len(organic_results)} results (Total: {len(all_organic_results)})")
+                logger.debug("Page %d: Found %d results (Total: %d)", page + 1, len(organic_results), len(all_organic_results))
 
                 # Stop if no more results
                 if len(organic_results) == 0:
@@ -341,7 +412,7 @@ class OfferVaultNetwork(BaseNetwork):
                     time.sleep(0.5)
 
             organic_results = all_organic_results
-            print(f"SerpAPI Total: Found {len(organic_results)} organic results across {page + 1} pages")
+            logger.info("SerpAPI Total: Found %d organic results across %d pages", len(organic_results), page + 1)
 
             direct_brand_count = 0  # Track how many direct brands we've processed
             max_extractions = 5  # Only extract details for first 5 direct brands (for speed)
@@ -356,13 +427,13 @@ class OfferVaultNetwork(BaseNetwork):
                         continue
 
                     # Extract domain for display
-                    domain = re.search(r'https?://(?:www\.)?([^/]+)', url)
+                    domain = _DOMAIN_RE.search(url)
                     domain_name = domain.group(1) if domain else url
 
                     # Skip only aggregator sites (not blogs)
                     skip_domains = ['offervault', 'affbank', 'odigger', 'reddit.com', 'quora.com']
                     if any(skip in domain_name.lower() for skip in skip_domains):
-                        print(f"Skipping aggregator: {domain_name}")
+                        logger.debug("Skipping aggregator: %s", domain_name)
                         continue
 
                     # Identify blog posts vs direct brands
@@ -373,7 +444,7 @@ class OfferVaultNetwork(BaseNetwork):
 
                     # Check if this is a direct brand affiliate page
                     # Look for /affiliate, /partner, /associates in the URL path
-                    is_direct_brand_page = bool(re.search(r'/(affiliate|partner|associates|referral)', url_lower))
+                    is_direct_brand_page = bool(_DIRECT_BRAND_RE.search(url_lower))
 
                     # Known blog/review domains
                     blog_domains = [
@@ -396,7 +467,7 @@ class OfferVaultNetwork(BaseNetwork):
                     ]
 
                     # Check for numbered lists (e.g., "15 Best", "Top 10")
-                    has_number_pattern = bool(re.search(r'\d+\s+(best|top|great|affiliate)', title_lower))
+                    has_number_pattern = bool(_NUM_LISTICLE_RE.search(title_lower))
 
                     # Check for "X best/top Y" patterns
                     has_listicle_pattern = any(pattern in title_lower for pattern in blog_title_patterns)
@@ -427,7 +498,7 @@ class OfferVaultNetwork(BaseNetwork):
                         commission_value = None
 
                         if direct_brand_count < max_extractions:
-                            print(f"Extracting details from {domain_name}...")
+                            logger.debug("Extracting details from %s...", domain_name)
                             commission_badge, comm_type, comm_value = self._extract_affiliate_details(url)
                             direct_brand_count += 1
 
@@ -435,7 +506,7 @@ class OfferVaultNetwork(BaseNetwork):
                                 commission_type = comm_type
                                 commission_value = comm_value
                         else:
-                            print(f"Skipping extraction for {domain_name} (limit reached)")
+                            logger.debug("Skipping extraction for %s (limit reached)", domain_name)
 
                         # Simple description
                         description = (
@@ -465,13 +536,13 @@ class OfferVaultNetwork(BaseNetwork):
                         break
 
                 except Exception as e:
-                    print(f"Error parsing result {idx}: {e}")
+                    logger.debug("Error parsing SerpAPI result %d: %s", idx, e)
                     continue
 
         except Exception as e:
-            print(f"Error using SerpAPI: {e}")
+            logger.error("Error using SerpAPI: %s", e)
 
-        print(f"Discovery: Found {len(offers)} affiliate programs from SerpAPI")
+        logger.info("Discovery: Found %d affiliate programs from SerpAPI", len(offers))
         return offers
 
     def _create_discovery_offers(self, keyword: str, limit: int = 5) -> List[Offer]:
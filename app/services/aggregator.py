@@ -191,6 +191,11 @@ class OfferAggregator:
             except Exception as e:
                 print(f"Cache read error: {e}")
 
+        # A forced refresh also drops the networks' in-memory caches
+        if force_refresh:
+            for network in self.networks + self.discovery_networks:
+                network.clear_cache()
+
         # Cache MISS or force refresh — fetch from APIs
         all_offers = []
 
@@ -0,0 +1,30 @@
+"""Text cleanup helpers for offer fields shown in the UI."""
+import re
+from functools import lru_cache
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+# A tag left unterminated by a cut: '<' starting a tag name, '/' or '!' with
+# no closing '>' before the end (a bare '<' in prose is left alone)
+_OPEN_TAG_TAIL_RE = re.compile(r'<[A-Za-z/!][^>]*$')
+
+
+def clip_html(text, limit):
+    """Cut text to limit characters, dropping any tag the cut left half-open."""
+    if len(text) <= limit:
+        return text
+    return _OPEN_TAG_TAIL_RE.sub('', text[:limit])
+
+
+# Lives in an imported module rather than the streamlit script, which is
+# re-executed on every rerun; this cache persists for the server process.
+@lru_cache(maxsize=4096)
+def strip_html_tags(text):
+    """Remove HTML tags from text (memoized; names and networks repeat across offers and reruns)."""
+    if not text:
+        return text
+    # Plain text (the common case) only needs whitespace collapsed
+    if '<' not in text:
+        return _WS_RE.sub(' ', text).strip()
+    # Remove HTML tags, then collapse extra whitespace
+    return _WS_RE.sub(' ', _TAG_RE.sub('', text)).strip()